@@ -14,9 +14,9 @@ class CrossEntropyLoss:
     """
     Cross entropy loss.
     """
-    REDUCTIONS: dict[str, Callable[..., float]] = {
-        "mean": np.mean,
-        "sum": np.sum
+    REDUCTIONS: dict[str, Callable[[NDArray], float]] = {
+        "mean": np.ndarray.mean,
+        "sum": np.ndarray.sum
     }
 
     def __init__(
@@ -31,7 +31,9 @@ class CrossEntropyLoss:
         """
         self._probabilities: NDArray | None = None
         self._target: NDArray | None = None
+        self._target_idx: NDArray | None = None
         self._reduction: str = ""
+        self._reduce: Callable[[NDArray], float] = np.ndarray.mean
         self.reduction = reduction
 
     # region Properties
@@ -54,6 +56,7 @@ class CrossEntropyLoss:
                 f" got {reduction}."
             )
         self._reduction = reduction
+        self._reduce = CrossEntropyLoss.REDUCTIONS[reduction]
     # endregion Properties
 
     # region Load
@@ -101,7 +104,8 @@ class CrossEntropyLoss:
 
         Args:
             logits: The logits to calculate the cross entropy loss on
-            targets: The one-hot encoded labels or the class labels
+            targets: The one-hot encoded labels or the class labels as a
+                list or an integer array
 
         Returns:
             The cross entropy loss.
@@ -117,34 +121,61 @@ class CrossEntropyLoss:
             )
 
         num_classes = logits.shape[-1]
+        target_idx: NDArray | None = None
         if isinstance(targets, list):
             if not isinstance(targets[0], int):
                 raise TypeError(
                     "Targets must either be a NumPy array or a list"
                     f" of ints, got a list of {type(targets[0]).__name__}."
                 )
-            try:
-                targets = utils.one_hot_encode(targets, num_classes)
-            except IndexError as ex:
-                raise ValueError(
-                    "Received a label index greater than the number"
-                    " of classes."
-                ) from ex
+            target_idx = np.asarray(targets, dtype=np.intp)
+        elif (
+            targets.ndim == logits.ndim - 1
+            and np.issubdtype(targets.dtype, np.integer)
+        ):
+            target_idx = targets.reshape(-1).astype(np.intp, copy=False)
 
-        if (
+        if target_idx is not None:
+            if len(logits.reshape(-1, num_classes)) != len(target_idx):
+                raise ValueError(
+                    f"The shape of logits ({logits.shape}) does not match the"
+                    f" number of targets ({len(target_idx)}).")
+        elif (
             logits.reshape(-1, num_classes).shape
             != targets.reshape(-1, num_classes).shape
         ):
             raise ValueError(
                 f"The shape of logits ({logits.shape}) does not match the"
                 f" shape of targets ({targets.shape}). ")
-        self._target = targets
-        self._probabilities = utils.softmax(logits)
 
-        return CrossEntropyLoss.REDUCTIONS[self.reduction](
-            -np.sum(targets * utils.log_softmax(logits), axis=-1),
-            axis=None
+        # Shift into a single floating point buffer that is reused for the
+        # exponential and then the probabilities, gathering what the loss
+        # needs from the shifted logits first
+        buffer = utils.shift_by_max(logits.reshape(-1, num_classes))
+        if target_idx is None:
+            target_rows = targets.reshape(-1, num_classes)
+            target_shifted = np.einsum("ij,ij->i", target_rows, buffer)
+            target_weight = np.add.reduce(target_rows, axis=-1)
+        else:
+            try:
+                target_shifted = buffer[np.arange(len(buffer)), target_idx]
+            except IndexError as ex:
+                raise ValueError(
+                    "Received a label index greater than the number"
+                    " of classes."
+                ) from ex
+            target_weight = 1
+
+        exp_sum = utils.inplace_shifted_softmax(buffer)
+        self._probabilities = buffer.reshape(logits.shape)
+        self._target = targets if target_idx is None else None
+        self._target_idx = target_idx
+
+        # -sum(targets * (shifted - log(exp_sum)))
+        negative_log_likelihood = (
+            np.log(exp_sum[:, 0]) * target_weight - target_shifted
         )
+        return self._reduce(negative_log_likelihood)
     # endregion Forward pass
 
     # region Backward pass
@@ -152,18 +183,34 @@ class CrossEntropyLoss:
         """
         Perform the backward pass using the previous forward inputs.
 
+        NOTE: The gradients are computed in place on the probabilities
+        stored by the forward pass, so forward must be called again
+        before the next backward pass.
+
         Returns:
             The gradients with respect to the predictions.
         """
-        if self._probabilities is None or self._target is None:
+        if self._probabilities is None or (
+            self._target is None and self._target_idx is None
+        ):
             raise RuntimeError("forward must be called before backward.")
 
+        grad = self._probabilities
+        self._probabilities = None
+
         # Rescale the gradients
-        batch_size = self._probabilities.shape[0]
-        if self.reduction == "sum" or len(self._probabilities.shape) == 1:
+        batch_size = grad.shape[0]
+        if self.reduction == "sum" or len(grad.shape) == 1:
             batch_size = 1
 
-        return (self._probabilities - self._target) / batch_size
+        if self._target_idx is None:
+            grad -= self._target.reshape(grad.shape)
+        else:
+            # Subtract the implicit one-hot target from the probabilities
+            rows = grad.reshape(-1, grad.shape[-1])
+            rows[np.arange(len(rows)), self._target_idx] -= 1
+        grad /= batch_size
+        return grad
 
     # endregion Backward pass
 
@@ -174,7 +221,8 @@ class CrossEntropyLoss:
 
         Args:
             logits: The logits to calculate the cross entropy loss on
-            targets: The one-hot encoded labels or the class labels
+            targets: The one-hot encoded labels or the class labels as a
+                list or an integer array
 
         Returns:
             The cross entropy loss.
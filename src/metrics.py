@@ -28,8 +28,8 @@ def get_new_confusion_matrix(num_classes: int) -> NDArray:
 
 def add_to_confusion_matrix(
     confusion_matrix: NDArray,
-    predictions: list[int],
-    actual: list[int]
+    predictions: list[int] | NDArray,
+    actual: list[int] | NDArray
 ) -> None:
     """
     Add the predictions to the given confusion matrix.
@@ -44,8 +44,15 @@ def add_to_confusion_matrix(
             "The length of predictions and actual does not match."
         )
 
-    for pred, act in zip(predictions, actual):
-        confusion_matrix[pred, act] += 1
+    # Unbuffered so repeated (prediction, actual) pairs are all counted
+    np.add.at(
+        confusion_matrix,
+        (
+            np.asarray(predictions, dtype=np.intp),
+            np.asarray(actual, dtype=np.intp)
+        ),
+        1
+    )
 # endregion Confusion matrix
 
 
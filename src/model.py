@@ -34,6 +34,17 @@ class Model:
         ".pkl": (pickle, True),
         ".json": (json, False)
     }
+    LAYER_CLASSES: dict[str, type[linear.Linear]] = {
+        name: class_
+        for name, class_ in vars(linear).items()
+        if isinstance(class_, type) and issubclass(class_, linear.Linear)
+    }
+    LOSS_CLASSES: dict[str, type[cross_entropy_loss.CrossEntropyLoss]] = {
+        name: class_
+        for name, class_ in vars(cross_entropy_loss).items()
+        if isinstance(class_, type)
+        and issubclass(class_, cross_entropy_loss.CrossEntropyLoss)
+    }
 
     def __init__(
         self,
@@ -78,10 +89,20 @@ class Model:
     @eval.setter
     def eval(self, eval_: bool) -> None:
         utils.check_type(eval_, bool, "eval")
+        self._set_eval(eval_)
+
+    def _set_eval(self, eval_: bool) -> None:
+        """
+        Set the evaluation mode of the model and its layers without
+        validating the type.
+
+        Args:
+            eval_: The evaluation mode
+        """
         if self._eval == eval_:
             return
 
-        for layer in self.layers:
+        for layer in self._layers:
             layer.eval = eval_
         self._eval = eval_
 
@@ -90,10 +111,10 @@ class Model:
         """
         Context manager to set the model into inference mode.
         """
-        prev_eval = self.eval
-        self.eval = True
+        prev_eval = self._eval
+        self._set_eval(True)
         yield
-        self.eval = prev_eval
+        self._set_eval(prev_eval)
     # endregion Evaluation mode
 
     # region Layers
@@ -231,11 +252,11 @@ class Model:
             )
 
         layers = [
-            getattr(linear, layer_attributes["class"])
+            Model.LAYER_CLASSES[layer_attributes["class"]]
             .from_dict(layer_attributes)
             for layer_attributes in attributes["layers"]
         ]
-        loss = getattr(cross_entropy_loss, attributes["loss"]["class"]) \
+        loss = Model.LOSS_CLASSES[attributes["loss"]["class"]] \
             .from_dict(attributes["loss"])
         return cls(layers, loss, **{
             key: val
@@ -349,7 +370,7 @@ class Model:
             The output values of the model.
         """
         out = input_
-        for layer in self.layers:
+        for layer in self._layers:
             out = layer(out)
         return out
 
@@ -395,12 +416,14 @@ class Model:
             The loss of the forward pass.
         """
         logits = self.forward(input_)
+        # Add the predicted classes as an array instead of converting them
+        # to a list, the loss computes the softmax itself
         metrics.add_to_confusion_matrix(
             confusion_matrix,
-            utils.logits_to_prediction(logits),
+            logits.argmax(axis=-1).reshape(-1),
             labels
         )
-        return self.loss(logits, labels)
+        return self._loss(logits, labels)
 
     def _train_step(
         self,
@@ -428,8 +451,8 @@ class Model:
             confusion_matrix,
             labels
         )
-        grad = self.loss.backward()
-        for layer in reversed(self.layers):
+        grad = self._loss.backward()
+        for layer in reversed(self._layers):
             grad = layer.update(grad, learning_rate)
         return loss
 
@@ -455,23 +478,23 @@ class Model:
             # Training
             training_data = data_loader("train", batch_size=batch_size)
             confusion_matrix = metrics.get_new_confusion_matrix(num_classes)
-            total_training_loss = sum(
-                self._train_step(
+            total_training_loss = 0.0
+            num_batches = 0
+            for data, labels in tqdm(
+                training_data,
+                desc=f"Training epoch {epoch}/{epochs}"
+            ):
+                total_training_loss += self._train_step(
                     data,
                     labels,
                     learning_rate,
                     confusion_matrix
                 )
-                for data, labels in tqdm(
-                    training_data,
-                    desc=f"Training epoch {epoch}/{epochs}"
-                )
-            )
-            training_loss = total_training_loss / len(training_data)
+                num_batches += 1
             Model.store_metrics(
                 self.train_metrics,
                 confusion_matrix,
-                training_loss
+                total_training_loss / num_batches
             )
             Model.print_metrics(
                 self.train_metrics,
@@ -523,18 +546,19 @@ class Model:
             confusion_matrix = metrics.get_new_confusion_matrix(
                 len(self.classes)
             )
-            loss = sum(
-                self.get_loss_with_confusion_matrix(
+            total_loss = 0.0
+            num_batches = 0
+            for data, labels in tqdm(
+                data_loader,
+                desc=tqdm_description
+            ):
+                total_loss += self.get_loss_with_confusion_matrix(
                     data,
                     confusion_matrix,
                     labels
                 )
-                for data, labels in tqdm(
-                    data_loader,
-                    desc=tqdm_description
-                )
-            ) / len(data_loader)
-        return loss, confusion_matrix
+                num_batches += 1
+        return total_loss / num_batches, confusion_matrix
     # endregion Test
 
     # region Metrics
@@ -13,6 +13,45 @@ from PIL import Image
 
 
 # region Mathematical functions
+# pylint does not recognise the keepdims argument of ufunc reductions
+# pylint: disable=unexpected-keyword-arg
+def shift_by_max(in_: NDArray) -> NDArray:
+    """
+    Subtract the row wise maximum from the input for numerical stability.
+
+    NOTE: Half precision inputs are shifted into single precision to avoid
+    losing precision when summing the exponentials.
+
+    Args:
+        in_: The input vector or matrix
+
+    Returns:
+        The shifted input as a new floating point array.
+    """
+    return np.subtract(
+        in_,
+        np.maximum.reduce(in_, axis=-1, keepdims=True),
+        dtype=np.promote_types(np.result_type(in_, 1.0), np.float32)
+    )
+
+
+def inplace_shifted_softmax(shifted: NDArray) -> NDArray:
+    """
+    Apply the softmax function in place to an input shifted by
+    shift_by_max.
+
+    Args:
+        shifted: The shifted input vector or matrix
+
+    Returns:
+        The row wise sums of the exponentials.
+    """
+    np.exp(shifted, out=shifted)
+    exp_sum = np.add.reduce(shifted, axis=-1, keepdims=True)
+    shifted /= exp_sum
+    return exp_sum
+
+
 def softmax(in_: NDArray) -> NDArray:
     """
     The softmax function.
@@ -23,8 +62,9 @@ def softmax(in_: NDArray) -> NDArray:
     Returns:
         The row wise probability vector of the given input.
     """
-    exp = np.exp(in_ - np.max(in_, axis=-1, keepdims=True))
-    return exp / exp.sum(axis=-1, keepdims=True)
+    probabilities = shift_by_max(in_)
+    inplace_shifted_softmax(probabilities)
+    return probabilities.astype(np.result_type(in_, 1.0), copy=False)
 
 
 def log_softmax(in_: NDArray) -> NDArray:
@@ -37,8 +77,12 @@ def log_softmax(in_: NDArray) -> NDArray:
     Returns:
         The log softmax of the given input.
     """
-    in_ -= np.max(in_, axis=-1, keepdims=True)  # For numerical stability
-    return in_ - np.log(np.exp(in_).sum(axis=-1, keepdims=True))
+    shifted = shift_by_max(in_)
+    shifted -= np.log(
+        np.add.reduce(np.exp(shifted), axis=-1, keepdims=True)
+    )
+    return shifted.astype(np.result_type(in_, 1.0), copy=False)
+# pylint: enable=unexpected-keyword-arg
 # endregion Mathematical functions
 
 
@@ -161,7 +205,9 @@ def logits_to_prediction(logits: NDArray) -> list[int]:
     """
     if len(logits.shape) == 1:
         logits = np.expand_dims(logits, 0)
-    return list(np.argmax(softmax(logits), axis=-1))
+    # Softmax preserves the ordering within each row, so the argmax of the
+    # logits is the predicted class
+    return list(np.argmax(logits, axis=-1))
 # endregion Array functions
 
 
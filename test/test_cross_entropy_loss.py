@@ -191,6 +191,12 @@ class TestCrossEntropyLoss:
             result,
             abs_tol=FLOAT_TOLERANCE
         )
+        if logits.ndim > 1:
+            assert math.isclose(
+                loss(logits, np.array(labels)),
+                result,
+                abs_tol=FLOAT_TOLERANCE
+            )
 
     @pytest.mark.parametrize("loss", [
         "mean", "sum"
@@ -232,7 +238,8 @@ class TestCrossEntropyLoss:
         (np.array([[1, 1, 1], [1, 1, 1]]), [1]),
         (np.array([[1, 1, 1]]), np.array([[0, 1, 0], [0, 0, 1]])),
         (np.array([[1, 1, 1], [1, 1, 1]]), np.array([[0, 1, 0]])),
-
+        (np.array([[1, 1, 1], [1, 1, 1]]), np.array([1])),
+        (np.array([[1, 1, 1]]), np.array([0, 1])),
     ])
     def test_forward_with_mismatched_shape(self, loss, data):
         """
@@ -247,8 +254,8 @@ class TestCrossEntropyLoss:
     ], indirect=["loss"])
     @pytest.mark.parametrize("data", [
         (np.array([1, 1, 1]), [3]),
-        (np.array([[1, 1, 1], [1, 1, 1]]), [1, 4])
-
+        (np.array([[1, 1, 1], [1, 1, 1]]), [1, 4]),
+        (np.array([[1, 1, 1], [1, 1, 1]]), np.array([1, 4]))
     ])
     def test_forward_with_invalid_labels(self, loss, data):
         """
@@ -298,6 +305,9 @@ class TestCrossEntropyLoss:
         assert np.allclose(loss.backward(), grad, atol=FLOAT_TOLERANCE)
         loss(logits, labels)
         assert np.allclose(loss.backward(), grad, atol=FLOAT_TOLERANCE)
+        if logits.ndim > 1:
+            loss(logits, np.array(labels))
+            assert np.allclose(loss.backward(), grad, atol=FLOAT_TOLERANCE)
 
     @pytest.mark.parametrize("loss, data", [
         ("mean", "data_small_close"),
@@ -317,6 +327,23 @@ class TestCrossEntropyLoss:
         loss.backward()
         loss(logits, labels)
         loss.backward()
+
+    @pytest.mark.parametrize("loss, data", [
+        ("mean", "data_small_close"),
+        ("sum", "data_large"),
+        ("mean", "data_large"),
+    ], indirect=["loss"])
+    def test_backward_twice_error(self, loss, data, request):
+        """
+        Test an error is raised when backward is called twice for the same
+        forward pass.
+        """
+        logits, one_hot_encoded, labels = request.getfixturevalue(data)
+        for targets in (one_hot_encoded, labels):
+            loss(logits, targets)
+            loss.backward()
+            with pytest.raises(RuntimeError):
+                loss.backward()
     # endregion Backward pass tests
 
     # region Built-ins tests
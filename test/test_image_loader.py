@@ -1,19 +1,51 @@
 """
 This module tests the image loader module.
 """
-from collections import Counter
+import os
 import pathlib
 import shutil
+import struct
 from typing import Callable
+import zlib
 
 import numpy as np
 from numpy.typing import NDArray
-from PIL import Image
 import pytest
 
 from src.image_loader import DatasetIterator, ImageLoader
 
 
+def write_grayscale_png(path: pathlib.Path, image: NDArray) -> None:
+    """
+    Write an 8-bit grayscale image as an uncompressed PNG file.
+
+    Args:
+        path: The path to write the image to
+        image: The two dimensional uint8 image
+    """
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+
+    height, width = image.shape
+    # Each scanline is prefixed with the "None" filter type
+    scanlines = b"".join(b"\x00" + row.tobytes() for row in image)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(
+            b"IHDR",
+            # Bit depth 8, colour type 0 (grayscale), default methods
+            struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+        )
+        + chunk(b"IDAT", zlib.compress(scanlines, 0))
+        + chunk(b"IEND", b"")
+    )
+
+
 # pylint: disable=protected-access, invalid-name, too-many-public-methods
 # pylint: disable=redefined-outer-name, too-many-arguments
 # pyright: reportGeneralTypeIssues=false
@@ -43,47 +75,48 @@ class TestFixtures:
         """
         Creates dummy files in a temporary path.
         """
-        tmp_path_factory.mktemp("0", numbered=False)
-        tmp_path_factory.mktemp("1", numbered=False)
-        tmp_path_factory.mktemp("2", numbered=False)
-
-        (tmp_path_factory.getbasetemp() / "0" / "a").mkdir()
-        (tmp_path_factory.getbasetemp() / "0" / "b").mkdir()
-        (tmp_path_factory.getbasetemp() / "1" / "a").mkdir()
-        (tmp_path_factory.getbasetemp() / "2" / "a").mkdir()
+        # Use a dedicated root so that other temporary paths made by the same
+        # pytest process or xdist worker are not picked up as classes
+        root = tmp_path_factory.mktemp("dataset")
+        (root / "0" / "a").mkdir(parents=True)
+        (root / "0" / "b").mkdir()
+        (root / "1" / "a").mkdir(parents=True)
+        (root / "2" / "a").mkdir(parents=True)
 
         for i, (x, label) in enumerate(zip(*data)):
-            image = Image.fromarray(x)
-            path = tmp_path_factory.getbasetemp() / str(label) /\
-                "a" / f"{i}.png"
-            image.save(path)
+            write_grayscale_png(root / str(label) / "a" / f"{i}.png", x)
 
-        yield tmp_path_factory.getbasetemp()
-        for dir_ in tmp_path_factory.getbasetemp().iterdir():
-            if not dir_.is_dir():
-                continue
-            shutil.rmtree(str(dir_))
+        yield root
+        shutil.rmtree(str(root))
 
     @pytest.fixture(scope="class")
     def dummy_files(self, dummy_folder) -> list[pathlib.Path]:
         """
         Gets all the dummy file paths.
         """
-        return list(
-            sorted(
-                dummy_folder.glob("**/*.png"),
-                key=lambda path: path.name
-            )
-        )
+        entries = []
+        for root, _, files in os.walk(dummy_folder):
+            for file in files:
+                if file.endswith(".png"):
+                    entries.append((file, os.path.join(root, file)))
+        entries.sort()
+        return [pathlib.Path(path) for _, path in entries]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    def all_png_files(self, dummy_folder) -> list[pathlib.Path]:
+        """
+        Gets all the dummy file paths in the order they are globbed.
+        """
+        return list(dummy_folder.glob("**/*.png"))
+
+    @pytest.fixture(scope="class")
     def preprocessing(self) -> list[Callable[..., NDArray]]:
         """
         Simple preprocessing steps.
         """
         return []
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def class_to_num(self) -> dict[str, int]:
         """
         Dictionary to convert class names to a number.
@@ -222,7 +255,7 @@ class TestDatasetIterator(TestFixtures):
             1,
             shuffle=shuffle
         )
-        assert Counter(iterator._data) == Counter(dummy_files)
+        assert sorted(iterator._data) == sorted(dummy_files)
 
     def test_init_with_invalid_preprocessing(
         self,
@@ -250,14 +283,11 @@ class TestDatasetIterator(TestFixtures):
 
     # region Iterator tests
     @pytest.mark.parametrize("iterator", [
-        (1, False),
-        (1, True),
-        (2, False),
-        (2, True),
-        (3, False),
-        (3, True),
-        (4, False),
-        (4, True),
+        (1, False),  # Exact fit
+        (2, False),  # Partial last batch kept
+        (2, True),  # Partial last batch dropped
+        (4, False),  # Batch larger than the dataset kept
+        (4, True),  # Batch larger than the dataset dropped
     ], indirect=["iterator"])
     def test_iter(self, iterator, data):
         """
@@ -326,6 +356,7 @@ class TestImageLoader(TestFixtures):
     def test_init(
         self,
         dummy_folder,
+        all_png_files,
         preprocessing,
     ):
         """
@@ -340,10 +371,8 @@ class TestImageLoader(TestFixtures):
         )
 
         # Fixture order is different
-        dummy_files = list(dummy_folder.glob("**/*.png"))
-
-        assert image_loader._train == dummy_files[:2]
-        assert image_loader._test == dummy_files[2:]
+        assert image_loader._train == all_png_files[:2]
+        assert image_loader._test == all_png_files[2:]
         assert image_loader._preprocessing == preprocessing
         assert image_loader.classes == ["0", "1", "2"]
         assert image_loader.classes_to_int == {"0": 0, "1": 1, "2": 2}
@@ -396,6 +425,7 @@ class TestImageLoader(TestFixtures):
     def test_init_shuffle(
         self,
         dummy_folder,
+        all_png_files,
         preprocessing,
     ):
         """
@@ -410,8 +440,7 @@ class TestImageLoader(TestFixtures):
         )
 
         # Fixture order is different
-        dummy_files = list(dummy_folder.glob("**/*.png"))
-        assert Counter(image_loader._train) == Counter(dummy_files)
+        assert sorted(image_loader._train) == sorted(all_png_files)
 
     def test_init_bad_path(
         self,
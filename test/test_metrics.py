@@ -47,6 +47,13 @@ class TestConfusionMatrix:
                 [1, 2, 0, 0],
                 [0, 1, 2, 0],
                 np.array([[1, 1, 2], [2, 0, 0], [0, 1, 0]]),
+            ),
+            (np.eye(3), [], [], np.eye(3)),
+            (
+                np.zeros((2, 2)),
+                [1, 1, 1],
+                [0, 0, 0],
+                np.array([[0, 0], [3, 0]])
             )
         ])
     def test_add_to_confusion_matrix(
@@ -641,6 +641,20 @@ class TestModel:
     # endregion Forward pass tests
 
     # region Backward pass / train tests
+    def test_get_loss_with_confusion_matrix(self, model, data):
+        """
+        Tests the loss and the confusion matrix updates for a minibatch.
+        """
+        X, y = data
+        confusion_matrix = np.zeros((2, 2))
+        loss = model.get_loss_with_confusion_matrix(X, confusion_matrix, y)
+        assert math.isclose(
+            loss,
+            CrossEntropyLoss("sum")(model(X), y),
+            abs_tol=FLOAT_TOLERANCE
+        )
+        assert np.array_equal(confusion_matrix, np.array([[3, 7], [0, 0]]))
+
     @pytest.mark.parametrize("mock_loader", [1], indirect=["mock_loader"])
     def test_train_no_validation(self, model, mock_loader):
         """
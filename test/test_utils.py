@@ -18,6 +18,8 @@ from src.utils import (
     one_hot_encode,
     softmax,
     log_softmax,
+    shift_by_max,
+    inplace_shifted_softmax,
     shuffle,
     image_to_array,
     normalise_array
@@ -26,6 +28,55 @@ from . import FLOAT_TOLERANCE
 
 
 # pylint: disable=invalid-name, too-few-public-methods
+class TestShiftByMax:
+    """
+    Shift by max function tester.
+    """
+    @pytest.mark.parametrize("x, expected", [
+        (np.array([1, 0, 0]), np.array([0, -1, -1])),
+        (
+            np.array([[1, 2, 3], [-1, -1, -1]]),
+            np.array([[-2, -1, 0], [0, 0, 0]])
+        )
+    ])
+    def test_shift_by_max(self, x, expected):
+        """
+        Tests the shift by max function.
+        """
+        shifted = shift_by_max(x)
+        assert np.array_equal(shifted, expected)
+        assert np.issubdtype(shifted.dtype, np.floating)
+        assert not np.shares_memory(shifted, x)
+
+
+class TestInplaceShiftedSoftmax:
+    """
+    In place shifted softmax function tester.
+    """
+    @pytest.mark.parametrize("x, true_p, true_sum", [
+        (
+            np.array([0., -1., -1.]),
+            np.array([0.57611688, 0.21194156, 0.21194156]),
+            np.array([1.73575888])
+        ),
+        (
+            np.array([[0., 0., 0.], [0., -999., -999.]]),
+            np.array([
+                [0.33333333, 0.33333333, 0.33333333],
+                [1., 0., 0.]
+            ]),
+            np.array([[3.], [1.]])
+        )
+    ])
+    def test_inplace_shifted_softmax(self, x, true_p, true_sum):
+        """
+        Tests the in place shifted softmax function.
+        """
+        exp_sum = inplace_shifted_softmax(x)
+        assert np.allclose(x, true_p, atol=FLOAT_TOLERANCE)
+        assert np.allclose(exp_sum, true_sum, atol=FLOAT_TOLERANCE)
+
+
 class TestSoftmax:
     """
     Softmax function tester.
@@ -57,6 +108,19 @@ class TestSoftmax:
         """
         assert np.allclose(softmax(x), true_p, atol=FLOAT_TOLERANCE)
 
+    @pytest.mark.parametrize("dtype, expected", [
+        (np.int64, np.float64),
+        (np.float16, np.float16),
+        (np.float32, np.float32),
+        (np.float64, np.float64)
+    ])
+    def test_softmax_dtype(self, dtype, expected):
+        """
+        Tests the softmax function keeps floating point inputs at their
+        precision.
+        """
+        assert softmax(np.array([[1, 0, 0]], dtype=dtype)).dtype == expected
+
 
 class TestLogSoftmax:
     """
@@ -96,6 +160,29 @@ class TestLogSoftmax:
         """
         assert np.allclose(log_softmax(x), true_p, atol=FLOAT_TOLERANCE)
 
+    @pytest.mark.parametrize("dtype, expected", [
+        (np.int64, np.float64),
+        (np.float16, np.float16),
+        (np.float32, np.float32),
+        (np.float64, np.float64)
+    ])
+    def test_log_softmax_dtype(self, dtype, expected):
+        """
+        Tests the log softmax function keeps floating point inputs at their
+        precision.
+        """
+        assert log_softmax(
+            np.array([[1, 0, 0]], dtype=dtype)
+        ).dtype == expected
+
+    def test_log_softmax_does_not_modify_input(self):
+        """
+        Tests the log softmax function leaves the input unchanged.
+        """
+        x = np.array([[1, 0, 0], [999, 0, 0]])
+        log_softmax(x)
+        assert np.array_equal(x, np.array([[1, 0, 0], [999, 0, 0]]))
+
 
 class TestShuffle:
     """